@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, time
 from pathlib import Path
 
 
@@ -13,10 +13,13 @@ def main():
     reservation_number = int(reservation[0])
     booker = reservation[1]
 
-    day = datetime.strptime(reservation[2], "%Y-%m-%d").date()
+    # Fixed-width yyyy-mm-dd and hh:mm, sliced directly instead of strptime
+    date_str = reservation[2]
+    day = date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
     finnish_day = day.strftime("%d.%m.%Y")
 
-    start_time = datetime.strptime(reservation[3], "%H:%M").time()
+    time_str = reservation[3]
+    start_time = time(int(time_str[0:2]), int(time_str[3:5]))
     finnish_time = start_time.strftime("%H.%M")
 
     hours = int(reservation[4])
@@ -32,17 +35,20 @@ def main():
     hourly_price_str = f"{hourly_price:.2f}".replace(".", ",")
     total_price_str = f"{total_price:.2f}".replace(".", ",")
 
-    print(f"Reservation number: {reservation_number}")
-    print(f"Booker: {booker}")
-    print(f"Date: {finnish_day}")
-    print(f"Start time: {finnish_time}")
-    print(f"Number of hours: {hours}")
-    print(f"Hourly price: {hourly_price_str} €")
-    print(f"Total price: {total_price_str} €")
-    print(f"Paid: {'Yes' if paid else 'No'}")
-    print(f"Location: {location}")
-    print(f"Phone: {phone}")
-    print(f"Email: {email}")
+    # One print for the whole reservation instead of one per field
+    print(
+        f"Reservation number: {reservation_number}\n"
+        f"Booker: {booker}\n"
+        f"Date: {finnish_day}\n"
+        f"Start time: {finnish_time}\n"
+        f"Number of hours: {hours}\n"
+        f"Hourly price: {hourly_price_str} €\n"
+        f"Total price: {total_price_str} €\n"
+        f"Paid: {'Yes' if paid else 'No'}\n"
+        f"Location: {location}\n"
+        f"Phone: {phone}\n"
+        f"Email: {email}"
+    )
 
 
 if __name__ == "__main__":
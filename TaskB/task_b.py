@@ -1,7 +1,17 @@
-from datetime import datetime
+from datetime import date, time
 from pathlib import Path
 
 
+def parse_date(value: str) -> date:
+    """Parses a fixed-width yyyy-mm-dd string into a date (no strptime)."""
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+def parse_time(value: str) -> time:
+    """Parses a fixed-width hh:mm string into a time (no strptime)."""
+    return time(int(value[0:2]), int(value[3:5]))
+
+
 def print_reservation_number(reservation: list[str]) -> None:
     """Prints the reservation number (int)."""
     reservation_number = int(reservation[0])
@@ -16,14 +26,14 @@ def print_booker(reservation: list[str]) -> None:
 
 def print_date(reservation: list[str]) -> None:
     """Prints the date in Finnish format (dd.mm.yyyy)."""
-    day = datetime.strptime(reservation[2], "%Y-%m-%d").date()
+    day = parse_date(reservation[2])
     finnish_day = day.strftime("%d.%m.%Y")
     print(f"Date: {finnish_day}")
 
 
 def print_start_time(reservation: list[str]) -> None:
     """Prints the start time in Finnish format (hh.mm)."""
-    start_time = datetime.strptime(reservation[3], "%H:%M").time()
+    start_time = parse_time(reservation[3])
     finnish_time = start_time.strftime("%H.%M")
     print(f"Start time: {finnish_time}")
 
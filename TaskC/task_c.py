@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime, time
+from functools import lru_cache
 from pathlib import Path
 
 HEADERS = [
@@ -16,34 +17,53 @@ HEADERS = [
 ]
 
 
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    """Parses a yyyy-mm-dd string (cached, dates repeat a lot)."""
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+@lru_cache(maxsize=4096)
+def _parse_time(value: str) -> time:
+    """Parses a hh:mm string (cached)."""
+    return time(int(value[0:2]), int(value[3:5]))
+
+
+@lru_cache(maxsize=4096)
+def _parse_dt(value: str) -> datetime:
+    """Parses a yyyy-mm-dd hh:mm:ss string (cached)."""
+    return datetime(
+        int(value[0:4]), int(value[5:7]), int(value[8:10]),
+        int(value[11:13]), int(value[14:16]), int(value[17:19]),
+    )
+
+
 def convert_reservation_data(reservation: list) -> list:
     """
     Convert data types to meet program requirements
 
     Parameters:
-     reservation (list): Unconverted reservation -> 11 columns (strings)
+     reservation (list): Unconverted reservation -> 11 columns (strings,
+                         line ending already removed)
 
     Returns:
      converted (list): Converted data types in correct order
     """
-    # Clean values (remove newline etc.)
-    row = [x.strip() for x in reservation]
-
-    reservation_id = int(row[0])
-    name = row[1]
-    email = row[2]
-    phone = row[3]
+    reservation_id = int(reservation[0])
+    name = reservation[1]
+    email = reservation[2]
+    phone = reservation[3]
 
-    reservation_date = datetime.strptime(row[4], "%Y-%m-%d").date()
-    reservation_time = datetime.strptime(row[5], "%H:%M").time()
+    reservation_date = _parse_date(reservation[4])
+    reservation_time = _parse_time(reservation[5])
 
-    duration_hours = int(row[6])
-    price = float(row[7])
+    duration_hours = int(reservation[6])
+    price = float(reservation[7])
 
-    confirmed = (row[8] == "True")
+    confirmed = (reservation[8] == "True")
 
-    reserved_resource = row[9]
-    created_at = datetime.strptime(row[10], "%Y-%m-%d %H:%M:%S")
+    reserved_resource = reservation[9]
+    created_at = _parse_dt(reservation[10])
 
     return [
         reservation_id,
@@ -68,24 +88,30 @@ def fetch_reservations(reservation_file: str) -> list:
     reservations = []
     with open(reservation_file, "r", encoding="utf-8") as f:
         for line in f:
-            fields = line.split("|")
+            # Only the last field carries the newline, strip it once per line
+            fields = line.rstrip("\r\n").split("|")
             reservations.append(convert_reservation_data(fields))
     return reservations
 
 
 def confirmed_reservations(reservations: list[list]) -> None:
     """1) Print confirmed reservations in required format."""
+    lines = []
     for r in reservations:
         if r[8]:
             name = r[1]
             resource = r[9]
             date_fi = r[4].strftime("%d.%m.%Y")
             time_fi = r[5].strftime("%H.%M")
-            print(f"- {name}, {resource}, {date_fi} at {time_fi}")
+            lines.append(f"- {name}, {resource}, {date_fi} at {time_fi}")
+
+    if lines:
+        print("\n".join(lines))
 
 
 def long_reservations(reservations: list[list]) -> None:
     """2) Print long reservations (duration >= 3h) in required format."""
+    lines = []
     for r in reservations:
         duration = r[6]
         if duration >= 3:
@@ -93,16 +119,23 @@ def long_reservations(reservations: list[list]) -> None:
             date_fi = r[4].strftime("%d.%m.%Y")
             time_fi = r[5].strftime("%H.%M")
             resource = r[9]
-            print(f"- {name}, {date_fi} at {time_fi}, duration {duration} h, {resource}")
+            lines.append(f"- {name}, {date_fi} at {time_fi}, duration {duration} h, {resource}")
+
+    if lines:
+        print("\n".join(lines))
 
 
 def confirmation_statuses(reservations: list[list]) -> None:
     """3) Print confirmation status for each reservation."""
+    lines = []
     for r in reservations:
         name = r[1]
         confirmed = r[8]
         status = "Confirmed" if confirmed else "NOT Confirmed"
-        print(f"{name} -> {status}")  # safer than unicode arrow
+        lines.append(f"{name} -> {status}")  # safer than unicode arrow
+
+    if lines:
+        print("\n".join(lines))
 
 
 def confirmation_summary(reservations: list[list]) -> None:
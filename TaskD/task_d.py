@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import csv
-from datetime import datetime, date
+from datetime import date
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 
-Row = Tuple[datetime, int, int, int, int, int, int]
+Row = Tuple[date, int, int, int, int, int, int]
 Totals = Dict[date, List[float]]  # [c1, c2, c3, p1, p2, p3] in kWh
 
 
@@ -21,23 +23,34 @@ FINNISH_WEEKDAYS = {
 }
 
 
+@lru_cache(maxsize=4096)
+def parse_day(value: str) -> date:
+    """Converts a yyyy-mm-dd string into a date object (cached)."""
+    return date.fromisoformat(value)
+
+
 def read_data(filename: str) -> List[Row]:
     """
     Reads the CSV file and returns rows in a structured format.
 
     Returns:
         List of tuples:
-        (timestamp_dt, c1_wh, c2_wh, c3_wh, p1_wh, p2_wh, p3_wh)
+        (day, c1_wh, c2_wh, c3_wh, p1_wh, p2_wh, p3_wh)
     """
     rows: List[Row] = []
+    append = rows.append  # bound once, the loop runs for every hour
 
     with open(filename, "r", encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter=";")
-        next(reader)  # skip header
+        # Plain semicolon data without quoting, so str.split is enough
+        next(f)  # skip header
 
-        for parts in reader:
-            # Example time: 2025-10-13T00:00:00
-            ts = datetime.fromisoformat(parts[0])
+        for line in f:
+            parts = line.rstrip("\n").split(";")
+            if len(parts) < 7:
+                continue
+
+            # Example time: 2025-10-13T00:00:00 -> only the date part is needed
+            day = parse_day(parts[0][:10])
 
             c1 = int(parts[1])
             c2 = int(parts[2])
@@ -46,24 +59,11 @@ def read_data(filename: str) -> List[Row]:
             p2 = int(parts[5])
             p3 = int(parts[6])
 
-            rows.append((ts, c1, c2, c3, p1, p2, p3))
+            append((day, c1, c2, c3, p1, p2, p3))
 
     return rows
 
 
-def wh_to_kwh(value_wh: float) -> float:
-    """
-    Converts Wh to kWh.
-
-    Args:
-        value_wh: energy in Wh
-
-    Returns:
-        energy in kWh
-    """
-    return value_wh / 1000.0
-
-
 def to_finnish_decimal(value: float) -> str:
     """
     Formats a float with two decimals and comma as decimal separator.
@@ -83,18 +83,11 @@ def calculate_daily_totals(rows: List[Row]) -> Totals:
     """
     totals: Totals = {}
 
-    for ts, c1, c2, c3, p1, p2, p3 in rows:
-        d = ts.date()
-
-        if d not in totals:
-            totals[d] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-
-        totals[d][0] += wh_to_kwh(c1)
-        totals[d][1] += wh_to_kwh(c2)
-        totals[d][2] += wh_to_kwh(c3)
-        totals[d][3] += wh_to_kwh(p1)
-        totals[d][4] += wh_to_kwh(p2)
-        totals[d][5] += wh_to_kwh(p3)
+    # Sort by day so groupby sees each day as one run, whatever the file order
+    for d, day_rows in groupby(sorted(rows, key=itemgetter(0)), key=itemgetter(0)):
+        # Column-wise sums in Wh (day column skipped), Wh -> kWh once per day
+        columns = list(zip(*day_rows))[1:]
+        totals[d] = [sum(col) / 1000.0 for col in columns]
 
     return totals
 
@@ -108,8 +101,6 @@ def print_report(daily: Totals) -> None:
     - Date: dd.mm.yyyy
     - Consumption/Production in kWh (2 decimals, comma decimal separator)
     """
-    print("Week 42 electricity consumption and production (kWh, by phase)\n")
-
     header1 = (
         "Day          Date        Consumption [kWh]               "
         "Production [kWh]"
@@ -118,9 +109,15 @@ def print_report(daily: Totals) -> None:
         "            (dd.mm.yyyy)  v1      v2      v3             "
         "v1     v2     v3"
     )
-    print(header1)
-    print(header2)
-    print("-" * 75)
+
+    # Collect the whole table and print it with a single call
+    lines = [
+        "Week 42 electricity consumption and production (kWh, by phase)",
+        "",
+        header1,
+        header2,
+        "-" * 75,
+    ]
 
     for d in sorted(daily.keys()):
         values = daily[d]
@@ -134,12 +131,14 @@ def print_report(daily: Totals) -> None:
         p2 = to_finnish_decimal(values[4])
         p3 = to_finnish_decimal(values[5])
 
-        print(
+        lines.append(
             f"{weekday_name:<12} {date_str:<10}  "
             f"{c1:>6}  {c2:>6}  {c3:>6}           "
             f"{p1:>6}  {p2:>6}  {p3:>6}"
         )
 
+    print("\n".join(lines))
+
 
 def main() -> None:
     """
@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
-import csv
 from dataclasses import dataclass
-from datetime import datetime, date
+from datetime import date
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -33,14 +35,10 @@ class DaySummary:
     prod_v3: float
 
 
-def parse_iso_datetime(value: str) -> datetime:
-    """Converts an ISO timestamp string into a datetime object."""
-    return datetime.fromisoformat(value.strip())
-
-
-def wh_to_kwh(value_wh: float) -> float:
-    """Converts Wh to kWh."""
-    return value_wh / 1000.0
+@lru_cache(maxsize=4096)
+def parse_iso_date(value: str) -> date:
+    """Converts an ISO date string (yyyy-mm-dd) into a date object."""
+    return date.fromisoformat(value)
 
 
 def format_kwh_fi(value: float) -> str:
@@ -61,17 +59,19 @@ def read_week_csv(path: Path) -> list[tuple[date, float, float, float, float, fl
     CSV uses semicolon delimiter and ISO timestamps.
     """
     rows: list[tuple[date, float, float, float, float, float, float]] = []
+    append = rows.append  # bound once, the loop runs for every hour
 
     with open(path, "r", encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter=";")
-        header = next(reader, None)  # skip header row
+        # Plain semicolon data without quoting, so str.split is enough
+        next(f, None)  # skip header row
 
-        for line in reader:
-            if not line or len(line) < 7:
+        for raw in f:
+            line = raw.rstrip("\n").split(";")
+            if len(line) < 7:
                 continue
 
-            dt = parse_iso_datetime(line[0])
-            day = dt.date()
+            # Timestamps are yyyy-mm-ddThh:mm:ss, only the date part is needed
+            day = parse_iso_date(line[0].strip()[:10])
 
             c1 = float(line[1])
             c2 = float(line[2])
@@ -80,7 +80,7 @@ def read_week_csv(path: Path) -> list[tuple[date, float, float, float, float, fl
             p2 = float(line[5])
             p3 = float(line[6])
 
-            rows.append((day, c1, c2, c3, p1, p2, p3))
+            append((day, c1, c2, c3, p1, p2, p3))
 
     return rows
 
@@ -92,31 +92,23 @@ def compute_daily_summaries(
     Groups hourly rows by day and returns a list of DaySummary objects
     in chronological order.
     """
-    totals: dict[date, list[float]] = {}
-
-    for day, c1, c2, c3, p1, p2, p3 in rows:
-        if day not in totals:
-            totals[day] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-        totals[day][0] += c1
-        totals[day][1] += c2
-        totals[day][2] += c3
-        totals[day][3] += p1
-        totals[day][4] += p2
-        totals[day][5] += p3
-
     summaries: list[DaySummary] = []
-    for d in sorted(totals.keys()):
-        c1_wh, c2_wh, c3_wh, p1_wh, p2_wh, p3_wh = totals[d]
+
+    # groupby only merges adjacent rows; sorting by day makes each day one run
+    for d, day_rows in groupby(sorted(rows, key=itemgetter(0)), key=itemgetter(0)):
+        # Column-wise sums in Wh (day column skipped), Wh -> kWh once per day
+        columns = list(zip(*day_rows))[1:]
+        c1, c2, c3, p1, p2, p3 = (sum(col) / 1000.0 for col in columns)
 
         summaries.append(
             DaySummary(
                 day=d,
-                cons_v1=wh_to_kwh(c1_wh),
-                cons_v2=wh_to_kwh(c2_wh),
-                cons_v3=wh_to_kwh(c3_wh),
-                prod_v1=wh_to_kwh(p1_wh),
-                prod_v2=wh_to_kwh(p2_wh),
-                prod_v3=wh_to_kwh(p3_wh),
+                cons_v1=c1,
+                cons_v2=c2,
+                cons_v3=c3,
+                prod_v1=p1,
+                prod_v2=p2,
+                prod_v3=p3,
             )
         )
 
@@ -157,8 +149,7 @@ def build_week_section(week_number: int, summaries: list[DaySummary]) -> str:
 
 def write_report(output_path: Path, content: str) -> None:
     """Writes the full report content to summary.txt using UTF-8 encoding."""
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    output_path.write_text(content, encoding="utf-8")
 
 
 def main() -> None:
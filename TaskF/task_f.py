@@ -3,25 +3,31 @@
 
 from __future__ import annotations
 
+import bisect
 import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, date
+from itertools import groupby
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 
-@dataclass(frozen=True)
-class Measurement:
-    """Represents one hourly measurement row from the CSV file."""
-    timestamp: datetime
-    consumption_kwh: float
-    production_kwh: float
-    temperature_c: float
+@dataclass
+class MeasurementTable:
+    """
+    Hourly measurements from the CSV file stored column-wise:
+    index i of every list belongs to the same hour (chronological order).
+    """
+    timestamps: List[datetime] = field(default_factory=list)
+    consumption_kwh: List[float] = field(default_factory=list)
+    production_kwh: List[float] = field(default_factory=list)
+    temperature_c: List[float] = field(default_factory=list)
 
 
 def parse_float_fi(value: str) -> float:
     """Parses a number that may use Finnish decimal comma into float."""
-    return float(value.strip().replace(",", "."))
+    # float() ignores surrounding whitespace itself, no strip() needed
+    return float(value.replace(",", "."))
 
 
 def format_float_fi(value: float) -> str:
@@ -34,9 +40,9 @@ def format_date_fi(d: date) -> str:
     return f"{d.day}.{d.month}.{d.year}"
 
 
-def read_data(path: Path) -> List[Measurement]:
+def read_data(path: Path) -> MeasurementTable:
     """
-    Reads 2025.csv and returns a list of Measurement rows.
+    Reads 2025.csv and returns the measurements as a MeasurementTable.
     The CSV is expected to contain:
       timestamp, consumption (kWh), production (kWh), temperature (°C)
     Separator may be ';' or ',' (auto-detected).
@@ -44,29 +50,33 @@ def read_data(path: Path) -> List[Measurement]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    # detect delimiter using a small sample
-    sample = path.read_text(encoding="utf-8", errors="ignore")[:2000]
-    delimiter = ";" if sample.count(";") >= sample.count(",") else ","
-
-    rows: List[Measurement] = []
+    table = MeasurementTable()
     with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=delimiter)
+        # detect delimiter from the header line
+        first = f.readline()
+        delimiter = ";" if first.count(";") >= first.count(",") else ","
 
         # normalize header keys
-        fieldnames = reader.fieldnames or []
-        normalized = {name: name.strip() for name in fieldnames}
+        fieldnames = [name.strip() for name in first.rstrip("\n").split(delimiter)]
+        reader = csv.DictReader(f, fieldnames=fieldnames, delimiter=delimiter)
+
+        # lowercased header -> header, built once for the lookups below
+        lower_headers: Dict[str, str] = {}
+        for name in fieldnames:
+            lower_headers.setdefault(name.lower(), name)
 
         # Try to find columns by common names
         # You can adjust these if your file uses different headers.
         def find_col(candidates: List[str]) -> str:
             for cand in candidates:
-                for fn in normalized.values():
-                    if fn.lower() == cand.lower():
-                        return fn
+                fn = lower_headers.get(cand.lower())
+                if fn is not None:
+                    return fn
             # fallback: try contains
             for cand in candidates:
-                for fn in normalized.values():
-                    if cand.lower() in fn.lower():
+                cand_lower = cand.lower()
+                for lower, fn in lower_headers.items():
+                    if cand_lower in lower:
                         return fn
             raise ValueError(f"Could not find column. Tried: {candidates}. Found headers: {fieldnames}")
 
@@ -75,32 +85,82 @@ def read_data(path: Path) -> List[Measurement]:
         col_prod = find_col(["production", "tuotanto", "production (net) in kwh", "production_kwh"])
         col_temp = find_col(["temperature", "avg temperature", "daily average temperature", "lampotila", "lämpötila", "temp"])
 
+        # Bind the column appends and the parser once for the ~8760-row loop
+        add_ts = table.timestamps.append
+        add_cons = table.consumption_kwh.append
+        add_prod = table.production_kwh.append
+        add_temp = table.temperature_c.append
+        fromisoformat = datetime.fromisoformat
+
         for row in reader:
             time_str = (row.get(col_time) or "").strip()
             if not time_str:
                 continue
 
             # Timestamp is ISO like 2025-10-13T00:00:00
-            ts = datetime.fromisoformat(time_str)
+            add_ts(fromisoformat(time_str))
+            add_cons(parse_float_fi(str(row.get(col_cons, "0"))))
+            add_prod(parse_float_fi(str(row.get(col_prod, "0"))))
+            add_temp(parse_float_fi(str(row.get(col_temp, "0"))))
 
-            cons = parse_float_fi(str(row.get(col_cons, "0")))
-            prod = parse_float_fi(str(row.get(col_prod, "0")))
-            temp = parse_float_fi(str(row.get(col_temp, "0")))
+    if not table.timestamps:
+        raise ValueError("No rows were read. Check delimiter and column names in 2025.csv.")
 
-            rows.append(Measurement(ts, cons, prod, temp))
+    # The day index and range lookups need rows in time order; sort all
+    # columns together once if the file is not already sorted.
+    ts = table.timestamps
+    if any(a > b for a, b in zip(ts, ts[1:])):
+        order = sorted(range(len(ts)), key=ts.__getitem__)
+        for column in (table.timestamps, table.consumption_kwh,
+                       table.production_kwh, table.temperature_c):
+            column[:] = [column[i] for i in order]
+    return table
 
-    if not rows:
-        raise ValueError("No rows were read. Check delimiter and column names in 2025.csv.")
-    return rows
+
+def build_day_offsets(table: MeasurementTable) -> Tuple[List[date], List[int]]:
+    """
+    Returns (days, offsets): the distinct dates in ascending order and the
+    row offsets where each day starts, so rows of days[i] are
+    offsets[i]:offsets[i + 1]. Relies on read_data having sorted the rows
+    chronologically.
+    """
+    days: List[date] = []
+    offsets: List[int] = [0]
+    for d, hours in groupby(ts.date() for ts in table.timestamps):
+        days.append(d)
+        offsets.append(offsets[-1] + sum(1 for _ in hours))
+    return days, offsets
 
 
-def build_daily_index(rows: List[Measurement]) -> Dict[date, List[Measurement]]:
-    """Groups measurements by date."""
-    daily: Dict[date, List[Measurement]] = {}
-    for m in rows:
-        d = m.timestamp.date()
-        daily.setdefault(d, []).append(m)
-    return daily
+def column_mean(column: List[float], rows: slice) -> float:
+    """Returns the average of column[rows], or 0.0 for an empty range."""
+    count = rows.stop - rows.start
+    return (sum(column[rows]) / count) if count else 0.0
+
+
+def build_daily_stats(
+    table: MeasurementTable, days: List[date], offsets: List[int]
+) -> Dict[date, Tuple[float, float, float]]:
+    """
+    Precomputes per-day aggregates once:
+    date -> (consumption kWh, production kWh, average temperature °C)
+    """
+    daily_stats: Dict[date, Tuple[float, float, float]] = {}
+    for i, d in enumerate(days):
+        rows = slice(offsets[i], offsets[i + 1])
+        daily_stats[d] = (
+            sum(table.consumption_kwh[rows]),
+            sum(table.production_kwh[rows]),
+            column_mean(table.temperature_c, rows),
+        )
+    return daily_stats
+
+
+def rows_between(days: List[date], offsets: List[int], start: date, end: date) -> slice:
+    """Returns the slice of table rows from start to end (inclusive)."""
+    lo = bisect.bisect_left(days, start)
+    hi = bisect.bisect_right(days, end)
+    return slice(offsets[lo], offsets[max(lo, hi)])
 
 
 def parse_date_input(prompt: str) -> date:
@@ -155,7 +215,9 @@ def show_after_menu() -> str:
     return input("Choose (1-3): ").strip()
 
 
-def create_daily_report(daily: Dict[date, List[Measurement]]) -> List[str]:
+def create_daily_report(
+    table: MeasurementTable, days: List[date], offsets: List[int]
+) -> List[str]:
     """Builds a report for a selected date range (inclusive)."""
     start = parse_date_input("Enter start date (dd.mm.yyyy): ")
     end = parse_date_input("Enter end date (dd.mm.yyyy): ")
@@ -163,20 +225,11 @@ def create_daily_report(daily: Dict[date, List[Measurement]]) -> List[str]:
     if end < start:
         start, end = end, start  # swap
 
-    total_cons = 0.0
-    total_prod = 0.0
-    temps: List[float] = []
-
-    cur = start
-    while cur <= end:
-        rows = daily.get(cur, [])
-        for m in rows:
-            total_cons += m.consumption_kwh
-            total_prod += m.production_kwh
-            temps.append(m.temperature_c)
-        cur = date.fromordinal(cur.toordinal() + 1)
-
-    avg_temp = (sum(temps) / len(temps)) if temps else 0.0
+    # Days are stored consecutively, so the range is one slice of rows
+    rows = rows_between(days, offsets, start, end)
+    total_cons = sum(table.consumption_kwh[rows])
+    total_prod = sum(table.production_kwh[rows])
+    avg_temp = column_mean(table.temperature_c, rows)
 
     lines = [
         "-" * 53,
@@ -197,7 +250,7 @@ def month_name_en(month: int) -> str:
     return names[month - 1]
 
 
-def create_monthly_report(daily: Dict[date, List[Measurement]]) -> List[str]:
+def create_monthly_report(daily_stats: Dict[date, Tuple[float, float, float]]) -> List[str]:
     """Builds a monthly summary report for a selected month number (1–12)."""
     month = ask_int_in_range("Enter month number (1–12): ", 1, 12)
 
@@ -206,12 +259,8 @@ def create_monthly_report(daily: Dict[date, List[Measurement]]) -> List[str]:
     daily_avg_temps: List[float] = []
 
     # For each day in the year that matches the month
-    for d, rows in daily.items():
+    for d, (day_cons, day_prod, day_temp_avg) in daily_stats.items():
         if d.year == 2025 and d.month == month:
-            day_cons = sum(m.consumption_kwh for m in rows)
-            day_prod = sum(m.production_kwh for m in rows)
-            day_temp_avg = (sum(m.temperature_c for m in rows) / len(rows)) if rows else 0.0
-
             total_cons += day_cons
             total_prod += day_prod
             daily_avg_temps.append(day_temp_avg)
@@ -228,13 +277,15 @@ def create_monthly_report(daily: Dict[date, List[Measurement]]) -> List[str]:
     return lines
 
 
-def create_yearly_report(rows: List[Measurement]) -> List[str]:
+def create_yearly_report(
+    table: MeasurementTable, days: List[date], offsets: List[int]
+) -> List[str]:
     """Builds a full-year 2025 summary report."""
-    year_rows = [m for m in rows if m.timestamp.year == 2025]
+    rows = rows_between(days, offsets, date(2025, 1, 1), date(2025, 12, 31))
 
-    total_cons = sum(m.consumption_kwh for m in year_rows)
-    total_prod = sum(m.production_kwh for m in year_rows)
-    avg_temp = (sum(m.temperature_c for m in year_rows) / len(year_rows)) if year_rows else 0.0
+    total_cons = sum(table.consumption_kwh[rows])
+    total_prod = sum(table.production_kwh[rows])
+    avg_temp = column_mean(table.temperature_c, rows)
 
     lines = [
         "-" * 53,
@@ -267,8 +318,9 @@ def main() -> None:
     csv_path = base_dir / "2025.csv"
     out_path = base_dir / "report.txt"
 
-    rows = read_data(csv_path)
-    daily = build_daily_index(rows)
+    table = read_data(csv_path)
+    days, offsets = build_day_offsets(table)
+    daily_stats = build_daily_stats(table, days, offsets)
 
     last_report: List[str] = []
 
@@ -276,15 +328,15 @@ def main() -> None:
         choice = show_main_menu()
 
         if choice == "1":
-            last_report = create_daily_report(daily)
+            last_report = create_daily_report(table, days, offsets)
             print_report_to_console(last_report)
 
         elif choice == "2":
-            last_report = create_monthly_report(daily)
+            last_report = create_monthly_report(daily_stats)
             print_report_to_console(last_report)
 
         elif choice == "3":
-            last_report = create_yearly_report(rows)
+            last_report = create_yearly_report(table, days, offsets)
             print_report_to_console(last_report)
 
         elif choice == "4":
@@ -11,13 +11,15 @@ and prints the same outputs as the original program.
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import datetime, date, time
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Reservation:
     """Represents one reservation as an object with attributes and helper methods."""
     reservation_id: int
@@ -31,6 +33,8 @@ class Reservation:
     confirmed: bool
     resource: str
     created: datetime
+    date_str: str  # date as dd.mm.yyyy, formatted once at load time
+    time_str: str  # time as hh.mm, formatted once at load time
 
     def is_confirmed(self) -> bool:
         """Return True if reservation is confirmed."""
@@ -45,64 +49,114 @@ class Reservation:
         return self.duration * self.price
 
 
+# Parsed values by raw string: reservation files repeat the same dates and
+# times a lot, so each distinct string is parsed once. createdAt is unique
+# per row and is not cached.
+# All formats are fixed-width, so parsing is integer slicing (no strptime).
+_DATE_CACHE: Dict[str, date] = {}
+_TIME_CACHE: Dict[str, time] = {}
+
+
+def parse_date(value: str) -> date:
+    """Parse a yyyy-mm-dd string into a date (memoized)."""
+    parsed = _DATE_CACHE.get(value)
+    if parsed is None:
+        parsed = _DATE_CACHE[value] = date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    return parsed
+
+
+def parse_time(value: str) -> time:
+    """Parse a hh:mm string into a time (memoized)."""
+    parsed = _TIME_CACHE.get(value)
+    if parsed is None:
+        parsed = _TIME_CACHE[value] = time(int(value[0:2]), int(value[3:5]))
+    return parsed
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse a yyyy-mm-dd hh:mm:ss string into a datetime."""
+    return datetime(
+        int(value[0:4]), int(value[5:7]), int(value[8:10]),
+        int(value[11:13]), int(value[14:16]), int(value[17:19]),
+    )
+
+
 def convert_reservation_data(fields: List[str]) -> Reservation:
     """Convert one reservation row (list of strings) into a Reservation object."""
+    raw_date = fields[4]
+    raw_time = fields[5].strip()
     return Reservation(
         reservation_id=int(fields[0]),
-        name=str(fields[1]),
-        email=str(fields[2]),
-        phone=str(fields[3]),
-        date=datetime.strptime(fields[4], "%Y-%m-%d").date(),
-        time=datetime.strptime(fields[5].strip(), "%H:%M").time(),
+        name=fields[1],
+        email=fields[2],
+        phone=fields[3],
+        date=parse_date(raw_date),
+        time=parse_time(raw_time),
         duration=int(fields[6]),
         price=float(fields[7]),
-        confirmed=True if fields[8].strip() == "True" else False,
-        resource=str(fields[9]),
-        created=datetime.strptime(fields[10].strip(), "%Y-%m-%d %H:%M:%S"),
+        confirmed=fields[8].strip() == "True",
+        resource=fields[9],
+        created=parse_datetime(fields[10].strip()),
+        date_str=f"{raw_date[8:10]}.{raw_date[5:7]}.{raw_date[0:4]}",
+        time_str=raw_time.replace(":", "."),
     )
 
 
-def fetch_reservations(reservation_file: str) -> List[Reservation]:
+def fetch_reservations(reservation_file: str | os.PathLike[str]) -> List[Reservation]:
     """Read reservations from a text file and return list of Reservation objects."""
-    reservations: List[Reservation] = []
+    # Read the whole file at once; text mode already turned line endings
+    # into "\n" (splitlines() would also split on characters like U+0085)
     with open(reservation_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            fields = line.split("|")
-            reservations.append(convert_reservation_data(fields))
-    return reservations
+        lines = f.read().split("\n")
+
+    return [
+        convert_reservation_data(line.split("|"))
+        for line in lines
+        if line and not line.isspace()
+    ]
 
 
 def confirmed_reservations(reservations: List[Reservation]) -> None:
     """Print confirmed reservations."""
+    lines: List[str] = []
     for r in reservations:
-        if r.is_confirmed():
-            print(f'- {r.name}, {r.resource}, {r.date.strftime("%d.%m.%Y")} at {r.time.strftime("%H.%M")}')
+        if r.confirmed:
+            lines.append(f'- {r.name}, {r.resource}, {r.date_str} at {r.time_str}')
+
+    if lines:
+        print("\n".join(lines))
 
 
 def long_reservations(reservations: List[Reservation]) -> None:
     """Print long reservations (duration > 3 hours) to match original logic."""
+    lines: List[str] = []
     for r in reservations:
         if r.duration > 3:
-            print(
-                f'- {r.name}, {r.date.strftime("%d.%m.%Y")} at {r.time.strftime("%H.%M")}, '
+            lines.append(
+                f'- {r.name}, {r.date_str} at {r.time_str}, '
                 f'duration {r.duration} h, {r.resource}'
             )
 
+    if lines:
+        print("\n".join(lines))
+
 
 def confirmation_statuses(reservations: List[Reservation]) -> None:
     """Print confirmation status for each reservation."""
+    lines: List[str] = []
     for r in reservations:
-        status = "Confirmed" if r.is_confirmed() else "NOT Confirmed"
+        status = "Confirmed" if r.confirmed else "NOT Confirmed"
         # NOTE: use ASCII "->" to avoid Windows cp1252 UnicodeEncodeError
-        print(f"{r.name} -> {status}")
+        lines.append(f"{r.name} -> {status}")
+
+    if lines:
+        print("\n".join(lines))
 
 
 def confirmation_summary(reservations: List[Reservation]) -> None:
     """Print how many are confirmed vs not confirmed."""
-    confirmed_count = len([r for r in reservations if r.is_confirmed()])
+    # confirmed is a bool, so summing it counts confirmed reservations
+    confirmed_count = sum(map(attrgetter("confirmed"), reservations))
     not_confirmed_count = len(reservations) - confirmed_count
     print(f"- Confirmed reservations: {confirmed_count} pcs")
     print(f"- Not confirmed reservations: {not_confirmed_count} pcs")
@@ -110,7 +164,7 @@ def confirmation_summary(reservations: List[Reservation]) -> None:
 
 def total_revenue(reservations: List[Reservation]) -> None:
     """Print total revenue from confirmed reservations (Finnish decimal comma)."""
-    revenue = sum(r.total_price() for r in reservations if r.is_confirmed())
+    revenue = sum(r.duration * r.price for r in reservations if r.confirmed)
     print(f"Total revenue from confirmed reservations: {revenue:.2f} EUR".replace(".", ","))
 
 
@@ -119,7 +173,7 @@ def main() -> None:
     base_dir = Path(__file__).parent
     reservations_path = base_dir / "reservations.txt"
 
-    reservations = fetch_reservations(str(reservations_path))
+    reservations = fetch_reservations(reservations_path)
 
     print("1) Confirmed Reservations")
     confirmed_reservations(reservations)